@@ -19,7 +19,6 @@ import enum
 import functools
 import json
 import logging
-import re
 import sys
 import traceback
 import uuid
@@ -178,6 +177,96 @@ def to_lsp_name(method_name):
     return ''.join(m_replaced)
 
 
+class StreamFramer:
+    """Incrementally splits a byte stream into JSON RPC message bodies.
+
+    Incoming chunks are appended to a single `bytearray` and a small state
+    machine walks the header lines and the body. Every byte is scanned at
+    most once, no matter how many chunks a message is split into, and a
+    chunk may contain any number of (partial) messages.
+
+    Attributes:
+        _buf(bytearray): Received bytes which are not consumed yet
+        _pos(int): Offset of the first unconsumed byte in `_buf`
+        _scan_pos(int): Offset from which to look for the next header line
+        _content_length(int): Length of the body, once its header is parsed
+        _in_body(bool): True once all headers of a message are read
+    """
+
+    CONTENT_LENGTH = b'content-length'
+    HEADER_SEPARATOR = b'\r\n'
+
+    # Compact the buffer once this many bytes are consumed
+    COMPACT_THRESHOLD = 64 * 1024
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+        self._scan_pos = 0
+        self._content_length = None
+        self._in_body = False
+
+    def _compact(self):
+        """Drops already consumed bytes from the buffer."""
+        if self._pos == len(self._buf):
+            self._buf.clear()
+        elif self._pos >= self.COMPACT_THRESHOLD:
+            del self._buf[:self._pos]
+        else:
+            return
+
+        self._scan_pos -= self._pos
+        self._pos = 0
+
+    def _parse_header(self, line):
+        """Extracts content length from a single header line."""
+        name, sep, value = line.partition(b':')
+        if sep and name.strip().lower() == self.CONTENT_LENGTH:
+            try:
+                self._content_length = int(value.strip())
+                logger.debug('Content length: %s', self._content_length)
+            except ValueError:
+                logger.error('Invalid content length header: %r', line)
+
+    def feed(self, data):
+        """Appends `data` to the buffer and yields every complete message body."""
+        buf = self._buf
+        buf += data
+
+        while True:
+            if not self._in_body:
+                end = buf.find(self.HEADER_SEPARATOR, self._scan_pos)
+                if end == -1:
+                    # Partial header line; the last byte may be a lone `\r`
+                    self._scan_pos = max(self._pos, len(buf) - 1)
+                    break
+
+                line = bytes(buf[self._pos:end])
+                self._pos = self._scan_pos = end + len(self.HEADER_SEPARATOR)
+
+                if line:
+                    self._parse_header(line)
+                elif self._content_length is None:
+                    logger.error('Message without content length header is skipped.')
+                else:
+                    self._in_body = True
+                continue
+
+            body_end = self._pos + self._content_length
+            if len(buf) < body_end:
+                # Message is incomplete; bail until more data arrives
+                break
+
+            body = bytes(buf[self._pos:body_end])
+            self._pos = self._scan_pos = body_end
+            self._content_length = None
+            self._in_body = False
+
+            yield body
+
+        self._compact()
+
+
 class JsonRPCProtocol(asyncio.Protocol):
     """Json RPC protocol implementation using on top of `asyncio.Protocol`.
 
@@ -192,14 +281,6 @@ class JsonRPCProtocol(asyncio.Protocol):
     CHARSET = 'utf-8'
     CONTENT_TYPE = 'application/vscode-jsonrpc'
 
-    MESSAGE_PATTERN = re.compile(
-        rb'^(?:[^\r\n]+\r\n)*'
-        + rb'Content-Length: (?P<length>\d+)\r\n'
-        + rb'(?:[^\r\n]+\r\n)*\r\n'
-        + rb'(?P<body>{.*)',
-        re.DOTALL,
-    )
-
     VERSION = '2.0'
 
     def __init__(self, server):
@@ -211,7 +292,7 @@ class JsonRPCProtocol(asyncio.Protocol):
 
         self.fm = FeatureManager(server)
         self.transport = None
-        self._message_buf = []
+        self._framer = StreamFramer()
 
     def __call__(self):
         return self
@@ -442,28 +523,7 @@ class JsonRPCProtocol(asyncio.Protocol):
         """Method from base class, called when server receives the data"""
         logger.debug('Received %r', data)
 
-        while len(data):
-            # Append the incoming chunk to the message buffer
-            self._message_buf.append(data)
-
-            # Look for the body of the message
-            message = b''.join(self._message_buf)
-            found = JsonRPCProtocol.MESSAGE_PATTERN.fullmatch(message)
-
-            body = found.group('body') if found else b''
-            length = int(found.group('length')) if found else 1
-
-            if len(body) < length:
-                # Message is incomplete; bail until more data arrives
-                return
-
-            # Message is complete;
-            # extract the body and any remaining data,
-            # and reset the buffer for the next message
-            body, data = body[:length], body[length:]
-            self._message_buf = []
-
-            # Parse the body
+        for body in self._framer.feed(data):
             self._procedure_handler(
                 json.loads(body.decode(self.CHARSET),
                            object_hook=deserialize_message))
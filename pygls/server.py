@@ -16,7 +16,6 @@
 ############################################################################
 import asyncio
 import logging
-import re
 import sys
 from concurrent.futures import Future, ThreadPoolExecutor
 from multiprocessing.pool import ThreadPool
@@ -35,45 +34,25 @@ logger = logging.getLogger(__name__)
 
 F = TypeVar('F', bound=Callable)
 
+READ_CHUNK_SIZE = 64 * 1024
 
-async def aio_readline(loop, executor, stop_event, rfile, proxy):
-    """Reads data from stdin in separate thread (asynchronously)."""
 
-    CONTENT_LENGTH_PATTERN = re.compile(rb'^Content-Length: (\d+)\r\n$')
+async def aio_readline(loop, executor, stop_event, rfile, proxy):
+    """Reads data from stdin in separate thread (asynchronously).
 
-    # Initialize message buffer
-    message = []
-    content_length = 0
+    Data is passed to `proxy` in chunks, as soon as it is available, and
+    splitting it into messages is left to the protocol.
+    """
+    # Prefer `read1` which returns as soon as any data is available
+    read = getattr(rfile, 'read1', rfile.readline)
 
     while not stop_event.is_set() and not rfile.closed:
-        # Read a header line
-        header = await loop.run_in_executor(executor, rfile.readline)
-        if not header:
+        data = await loop.run_in_executor(executor, read, READ_CHUNK_SIZE)
+        if not data:
             break
-        message.append(header)
-
-        # Extract content length if possible
-        if not content_length:
-            match = CONTENT_LENGTH_PATTERN.fullmatch(header)
-            if match:
-                content_length = int(match.group(1))
-                logger.debug('Content length: %s', content_length)
-
-        # Check if all headers have been read (as indicated by an empty line \r\n)
-        if content_length and not header.strip():
-
-            # Read body
-            body = await loop.run_in_executor(executor, rfile.read, content_length)
-            if not body:
-                break
-            message.append(body)
-
-            # Pass message to language server protocol
-            proxy(b''.join(message))
-
-            # Reset the buffer
-            message = []
-            content_length = 0
+
+        # Pass data to language server protocol
+        proxy(data)
 
 
 class StdOutTransportAdapter:
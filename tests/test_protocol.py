@@ -24,7 +24,8 @@ import pytest
 from pygls.exceptions import JsonRpcException, JsonRpcInvalidParams
 from pygls.lsp import Model, get_method_params_type
 from pygls.lsp.types import ClientCapabilities, InitializeParams, InitializeResult
-from pygls.protocol import JsonRPCNotification, JsonRPCRequestMessage, JsonRPCResponseMessage
+from pygls.protocol import (JsonRPCNotification, JsonRPCRequestMessage, JsonRPCResponseMessage,
+                            StreamFramer)
 from pygls.protocol import deserialize_message as _deserialize_message
 from pygls.protocol import to_lsp_name
 
@@ -253,6 +254,59 @@ def test_data_received_error_should_raise_jsonrpc_error(client_server):
         future.result()
 
 
+def test_stream_framer_byte_by_byte():
+    framer = StreamFramer()
+    data = dummy_message(1) + dummy_message(2)
+
+    bodies = []
+    for i in range(len(data)):
+        bodies.extend(framer.feed(data[i:i + 1]))
+
+    assert [json.loads(body)['params'] for body in bodies] == [1, 2]
+    assert len(framer._buf) == 0
+
+
+def test_stream_framer_header_split_between_cr_and_lf():
+    framer = StreamFramer()
+    data = dummy_message()
+    split = data.index(b'\r\n') + 1
+
+    assert list(framer.feed(data[:split])) == []
+    assert [json.loads(body)['params'] for body in framer.feed(data[split:])] == [1]
+
+
+def test_stream_framer_multi_message_chunk():
+    framer = StreamFramer()
+    data = b''.join(dummy_message(i) for i in range(3))
+
+    bodies = list(framer.feed(data + dummy_message(3)[:10]))
+
+    assert [json.loads(body)['params'] for body in bodies] == [0, 1, 2]
+    assert list(framer.feed(dummy_message(3)[10:])) == [
+        json.dumps({"jsonrpc": "2.0", "method": "test", "params": 3}).encode('utf-8')
+    ]
+
+
+def test_stream_framer_large_body_in_chunks():
+    framer = StreamFramer()
+    data = dummy_message('x' * 500_000)
+    chunk_size = 64 * 1024
+
+    bodies = []
+    for i in range(0, len(data), chunk_size):
+        bodies.extend(framer.feed(data[i:i + chunk_size]))
+
+    assert len(bodies) == 1
+    assert json.loads(bodies[0])['params'] == 'x' * 500_000
+
+
+def test_stream_framer_skips_message_without_content_length():
+    framer = StreamFramer()
+    data = b'Content-Type: application/vscode-jsonrpc\r\n\r\n' + dummy_message()
+
+    assert [json.loads(body)['params'] for body in framer.feed(data)] == [1]
+
+
 def test_initialize_should_return_server_capabilities(client_server):
     _, server = client_server
     params = InitializeParams(